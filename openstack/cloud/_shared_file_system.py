@@ -10,7 +10,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
+
+from openstack.cloud import _utils
 from openstack.cloud import openstackcloud
+from openstack import exceptions
+from openstack import resource
 
 
 class SharedFileSystemCloudMixin(openstackcloud._OpenStackCloudMixin):
@@ -20,3 +25,236 @@ class SharedFileSystemCloudMixin(openstackcloud._OpenStackCloudMixin):
         :returns: A list of Shared File Systems Availability Zones.
         """
         return list(self.share.availability_zones())
+
+    def list_shares(self, **filters):
+        """List all shares.
+
+        :param filters: Optional query parameters to be sent to limit the
+            shares being returned, as accepted by
+            :meth:`~openstack.shared_file_system.v2._proxy.Proxy.shares`.
+        :returns: A list of share ``Share`` objects.
+        """
+        return list(self.share.shares(**filters))
+
+    def search_shares(self, name_or_id=None, filters=None):
+        """Search for one or more shares.
+
+        :param name_or_id: Name or unique ID of share(s).
+        :param filters: A dictionary of meta data to use for further
+            filtering. Elements of this dictionary may, themselves, be
+            dictionaries. Example::
+
+                {'last_name': 'Smith', 'other': {'gender': 'Female'}}
+
+            OR
+
+            A string containing a jmespath expression for further filtering.
+            Example::
+
+                "[?last_name==`Smith`] | [?other.gender]==`Female`]"
+
+        :returns: A list of share ``Share`` objects, if any are found.
+        """
+        # Filter the proxy generator directly so that only matching shares
+        # are retained, rather than materialising every share first.
+        # jmespath needs a real list to search.
+        shares = self.share.shares()
+        if (not name_or_id and not filters) or isinstance(filters, str):
+            shares = list(shares)
+        return _utils._filter_list(shares, name_or_id, filters)
+
+    def get_share(self, name_or_id):
+        """Get a share by name or ID.
+
+        :param name_or_id: Name or unique ID of the share.
+        :returns: A share ``Share`` object if found, else None.
+        """
+        return self.share.find_share(name_or_id)
+
+    def get_share_by_id(self, id):
+        """Get a share by ID.
+
+        :param id: ID of the share.
+        :returns: A share ``Share`` object.
+        :raises: :class:`~openstack.exceptions.NotFoundException` if the share
+            does not exist.
+        """
+        return self.share.get_share(id)
+
+    def get_share_id(self, name_or_id):
+        """Get ID of a share.
+
+        :param name_or_id: Name or unique ID of the share.
+        :returns: The ID of the share if found, else None.
+        """
+        share = self.get_share(name_or_id)
+        if share:
+            return share['id']
+        return None
+
+    def share_exists(self, name_or_id):
+        """Check if a share exists.
+
+        :param name_or_id: Name or unique ID of the share.
+        :returns: True if the share exists, else False.
+        """
+        return self.get_share(name_or_id) is not None
+
+    def create_share(
+        self,
+        size,
+        share_protocol,
+        wait=True,
+        timeout=None,
+        **kwargs,
+    ):
+        """Create a share.
+
+        :param size: Size, in GiB, of the share to create.
+        :param share_protocol: The Shared File Systems protocol of the share,
+            such as NFS or CIFS.
+        :param wait: If true, waits for the share to become available.
+        :param timeout: Seconds to wait for share creation. None is forever.
+        :param kwargs: Additional share attributes, such as ``name``,
+            ``description`` or ``share_type``.
+
+        :returns: The created share ``Share`` object.
+        :raises: :class:`~openstack.exceptions.ResourceTimeout` if wait time
+            exceeded.
+        :raises: :class:`~openstack.exceptions.ResourceFailure` if the share
+            transitions to an error state while waiting.
+        :raises: :class:`~openstack.exceptions.SDKException` on operation
+            error.
+        """
+        share = self.share.create_share(
+            size=size, share_protocol=share_protocol, **kwargs
+        )
+
+        if share['status'] == 'error':
+            raise exceptions.SDKException("Error in creating share")
+
+        if wait:
+            share = self.share.wait_for_status(
+                share, 'available', wait=timeout
+            )
+
+        return share
+
+    def update_share(
+        self,
+        name_or_id,
+        display_name=None,
+        display_description=None,
+        is_public=None,
+    ):
+        """Update a share.
+
+        :param name_or_id: Name, unique ID or
+            :class:`openstack.shared_file_system.v2.share.Share` instance of
+            the share.
+        :param display_name: (optional) The new name of the share.
+        :param display_description: (optional) The new description of the
+            share.
+        :param is_public: (optional) The new level of visibility of the share.
+
+        :returns: The updated share ``Share`` object.
+        :raises: :class:`~openstack.exceptions.SDKException` if the share does
+            not exist.
+        """
+        if isinstance(name_or_id, resource.Resource):
+            share = name_or_id
+        else:
+            share = self.get_share(name_or_id)
+        if not share:
+            raise exceptions.SDKException(f"Share {name_or_id} not found.")
+
+        attrs = {
+            k: v
+            for k, v in (
+                ('display_name', display_name),
+                ('display_description', display_description),
+                ('is_public', is_public),
+            )
+            if v is not None
+        }
+        if not attrs:
+            return share
+
+        return self.share.update_share(share, **attrs)
+
+    def delete_share(self, name_or_id, wait=True, timeout=None):
+        """Delete a share.
+
+        :param name_or_id: Name, unique ID or
+            :class:`openstack.shared_file_system.v2.share.Share` instance of
+            the share. Passing an instance avoids looking the share up again.
+        :param wait: If true, waits for the share to be deleted.
+        :param timeout: Seconds to wait for share deletion. None is forever.
+
+        :returns: True if deletion was successful, else False.
+        :raises: :class:`~openstack.exceptions.ResourceTimeout` if wait time
+            exceeded.
+        :raises: :class:`~openstack.exceptions.SDKException` on operation
+            error.
+        """
+        if isinstance(name_or_id, resource.Resource):
+            share = name_or_id
+        else:
+            share = self.share.find_share(name_or_id, ignore_missing=True)
+        if not share:
+            self.log.debug(
+                "Share %(name_or_id)s does not exist",
+                {'name_or_id': name_or_id},
+            )
+            return False
+
+        try:
+            self.share.delete_share(share, ignore_missing=False)
+        except exceptions.NotFoundException:
+            # A Share instance may be stale, or the share may have been
+            # deleted concurrently since it was looked up
+            self.log.debug(
+                "Share %(name_or_id)s does not exist",
+                {'name_or_id': share['id']},
+            )
+            return False
+
+        if wait:
+            self.share.wait_for_delete(share, wait=timeout)
+
+        return True
+
+    def delete_shares(self, name_or_ids, wait=True, timeout=None):
+        """Delete several shares concurrently.
+
+        The deletions are submitted to the connection's thread pool, so the
+        number of shares deleted at once is bounded by its size. Requests
+        are further limited by the ``rate_limit`` configured for the
+        service, if any.
+
+        :param name_or_ids: A list of names, unique IDs or
+            :class:`openstack.shared_file_system.v2.share.Share` instances of
+            shares.
+        :param wait: If true, waits for the shares to be deleted.
+        :param timeout: Seconds to wait for each share deletion. None is
+            forever.
+
+        :returns: A list with, for each share in ``name_or_ids``, True if the
+            deletion was successful, else False.
+        :raises: :class:`~openstack.exceptions.ResourceTimeout` if wait time
+            exceeded.
+        :raises: :class:`~openstack.exceptions.SDKException` on operation
+            error.
+        """
+        futures = [
+            self._pool_executor.submit(
+                self.delete_share, name_or_id, wait=wait, timeout=timeout
+            )
+            for name_or_id in name_or_ids
+        ]
+        # Surface the first failure as soon as it happens rather than after
+        # every other deletion has been waited on.
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
+
+        return [future.result() for future in futures]
@@ -165,8 +165,16 @@ class Proxy(adapter.Adapter):
             log_name = 'openstack'
         self.log = _log.setup_logging(log_name)
 
-    def _get_cache_key_prefix(self, url: str) -> str:
-        """Calculate cache prefix for the url"""
+    def _get_cache_key_prefix(self, url: str, top_level: bool = False) -> str:
+        """Calculate cache prefix for the url
+
+        :param url: The URL of the request.
+        :param top_level: Only use the top-level resource of the url. A
+            modification of a sub-resource or an action on a resource, such as
+            ``/servers/{id}/action``, changes the resource itself, so every
+            entry cached for the top-level resource and its listings should
+            be invalidated.
+        """
         if not self.service_type:
             # narrow type
             raise RuntimeError('expected service_type to be set')
@@ -174,6 +182,8 @@ class Proxy(adapter.Adapter):
         name_parts = self._extract_name(
             url, self.service_type, self.session.get_project_id()
         )
+        if top_level:
+            name_parts = name_parts[:1]
 
         return '.'.join([self.service_type] + name_parts)
 
@@ -194,7 +204,7 @@ class Proxy(adapter.Adapter):
         method: str,
         error_message: str | None = None,
         raise_exc: bool = False,
-        connect_retries: int = 1,
+        connect_retries: int | None = None,
         global_request_id: str | None = None,
         *args: ty.Any,
         **kwargs: ty.Any,
@@ -208,6 +218,13 @@ class Proxy(adapter.Adapter):
             # Per-request setting should take precedence
             global_request_id = conn._global_request_id
 
+        if connect_retries is None:
+            # Honour the configured connect_retries, which the adapter would
+            # otherwise only use as a default for an unset argument
+            connect_retries = (
+                self.connect_retries if self.connect_retries is not None else 1
+            )
+
         key = None
         key_prefix = self._get_cache_key_prefix(url)
         # The caller might want to force cache bypass.
@@ -247,6 +264,10 @@ class Proxy(adapter.Adapter):
             else:
                 # invalidate cache if we send modification request or user
                 # asked for cache bypass
+                if method not in ('GET', 'HEAD'):
+                    key_prefix = self._get_cache_key_prefix(
+                        url, top_level=True
+                    )
                 self._invalidate_cache(conn, key_prefix)
                 # Pass through the API request bypassing cache
                 response = super().request(
@@ -320,15 +320,6 @@ class QueryParameters:
                 name = server_side
                 type_ = None
 
-            # NOTE(dtantsur): a small hack to be compatible with both
-            # single-argument (like int) and double-argument type functions.
-            try:
-                provide_resource_type = (
-                    len(inspect.getfullargspec(type_).args) > 1
-                )
-            except TypeError:
-                provide_resource_type = False
-
             if client_side in query:
                 value = query[client_side]
             elif name in query:
@@ -337,6 +328,16 @@ class QueryParameters:
                 continue
 
             if type_ is not None:
+                # NOTE(dtantsur): a small hack to be compatible with both
+                # single-argument (like int) and double-argument type
+                # functions.
+                try:
+                    provide_resource_type = (
+                        len(inspect.getfullargspec(type_).args) > 1
+                    )
+                except TypeError:
+                    provide_resource_type = False
+
                 if provide_resource_type:
                     result[name] = type_(value, resource_type)
                 else:
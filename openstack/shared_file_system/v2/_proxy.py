@@ -122,7 +122,9 @@ class Proxy(proxy.Proxy):
         base_path = '/shares/detail' if details else None
         return self._list(_share.Share, base_path=base_path, **query)
 
-    def find_share(self, name_or_id, ignore_missing=True, **query):
+    def find_share(
+        self, name_or_id, ignore_missing=True, *, details=True, **query
+    ):
         """Find a single share
 
         :param name_or_id: The name or ID of a share.
@@ -131,15 +133,23 @@ class Proxy(proxy.Proxy):
             raised when the resource does not exist.
             When set to ``True``, None will be returned when
             attempting to find a nonexistent resource.
+        :param bool details: When set to ``False`` no extended attributes
+            will be returned when the share is found by name. The default,
+            ``True``, will cause objects with additional attributes to be
+            returned.
         :param dict query: Any additional parameters to be passed into
             underlying methods. such as query filters.
 
         :returns: One :class:`~openstack.shared_file_system.v2.share.Share`
                   or None
         """
-
+        list_base_path = '/shares/detail' if details else None
         return self._find(
-            _share.Share, name_or_id, ignore_missing=ignore_missing, **query
+            _share.Share,
+            name_or_id,
+            ignore_missing=ignore_missing,
+            list_base_path=list_base_path,
+            **query,
         )
 
     def get_share(self, share_id):
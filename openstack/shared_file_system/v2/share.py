@@ -21,6 +21,11 @@ class Share(resource.Resource, metadata.MetadataMixin):
     resources_key = "shares"
     base_path = "/shares"
 
+    # Action requests only vary by share ID, so build the URL template and
+    # headers once. The headers are copied by keystoneauth on every request.
+    _action_url_template = utils.urljoin(base_path, '{}', 'action')
+    _action_headers = {'Accept': ''}
+
     # capabilities
     allow_create = True
     allow_fetch = True
@@ -29,6 +34,24 @@ class Share(resource.Resource, metadata.MetadataMixin):
     allow_head = False
     allow_delete = True
 
+    _query_mapping = resource.QueryParameters(
+        "name",
+        "status",
+        "project_id",
+        "share_server_id",
+        "share_type_id",
+        "snapshot_id",
+        "host",
+        "share_network_id",
+        "share_group_id",
+        "export_location_id",
+        "export_location_path",
+        "offset",
+        "sort_key",
+        "sort_dir",
+        all_projects="all_tenants",
+    )
+
     #: Properties
     #: The share instance access rules status. A valid value is active,
     #: error, or syncing.
@@ -109,14 +132,16 @@ class Share(resource.Resource, metadata.MetadataMixin):
 
     def _action(self, session, body, microversion=None):
         """Perform share instance actions given the message body"""
-        url = utils.urljoin(self.base_path, self.id, 'action')
-        headers = {'Accept': ''}
+        url = self._action_url_template.format(self.id)
 
         if microversion is None:
             microversion = self._get_microversion(session)
 
         response = session.post(
-            url, json=body, headers=headers, microversion=microversion
+            url,
+            json=body,
+            headers=self._action_headers,
+            microversion=microversion,
         )
 
         exceptions.raise_from_response(response)
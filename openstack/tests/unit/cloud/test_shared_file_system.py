@@ -10,8 +10,12 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import threading
+from unittest import mock
 import uuid
 
+from openstack import exceptions
+from openstack.shared_file_system.v2 import share as _share
 from openstack.tests.unit import base
 
 
@@ -22,6 +26,14 @@ MANILA_AZ_DICT = {
     "created_at": "2021-01-21T20:13:55.000000",
     "updated_at": None,
 }
+SHARE_ID = str(uuid.uuid4())
+MANILA_SHARE_DICT = {
+    "id": SHARE_ID,
+    "name": "share-0",
+    "size": 1,
+    "share_proto": "NFS",
+    "status": "available",
+}
 
 
 class TestSharedFileSystem(base.TestCase):
@@ -50,3 +62,408 @@ class TestSharedFileSystem(base.TestCase):
         self.assertEqual(MANILA_AZ_DICT['created_at'], az_list[0].created_at)
         self.assertEqual(MANILA_AZ_DICT['updated_at'], az_list[0].updated_at)
         self.assert_calls()
+
+    def test_list_shares(self):
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'shared-file-system',
+                        'public',
+                        append=['v2', 'shares', 'detail'],
+                    ),
+                    json={'shares': [MANILA_SHARE_DICT]},
+                ),
+            ]
+        )
+        shares = self.cloud.list_shares()
+        self.assertEqual(1, len(shares))
+        self.assertEqual(SHARE_ID, shares[0].id)
+        self.assertEqual('NFS', shares[0].share_protocol)
+        self.assert_calls()
+
+    def test_search_shares(self):
+        other = dict(MANILA_SHARE_DICT, id=str(uuid.uuid4()), name='other')
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'shared-file-system',
+                        'public',
+                        append=['v2', 'shares', 'detail'],
+                    ),
+                    json={'shares': [MANILA_SHARE_DICT, other]},
+                ),
+            ]
+        )
+        shares = self.cloud.search_shares('share-*')
+        self.assertEqual([SHARE_ID], [s.id for s in shares])
+        self.assert_calls()
+
+    def test_search_shares_filters(self):
+        other = dict(MANILA_SHARE_DICT, id=str(uuid.uuid4()), status='error')
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'shared-file-system',
+                        'public',
+                        append=['v2', 'shares', 'detail'],
+                    ),
+                    json={'shares': [MANILA_SHARE_DICT, other]},
+                ),
+            ]
+        )
+        shares = self.cloud.search_shares(filters={'status': 'error'})
+        self.assertEqual([other['id']], [s.id for s in shares])
+        self.assert_calls()
+
+    def test_search_shares_no_filters(self):
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'shared-file-system',
+                        'public',
+                        append=['v2', 'shares', 'detail'],
+                    ),
+                    json={'shares': [MANILA_SHARE_DICT]},
+                ),
+            ]
+        )
+        shares = self.cloud.search_shares()
+        self.assertIsInstance(shares, list)
+        self.assertEqual([SHARE_ID], [s.id for s in shares])
+        self.assert_calls()
+
+    def test_search_shares_jmespath(self):
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'shared-file-system',
+                        'public',
+                        append=['v2', 'shares', 'detail'],
+                    ),
+                    json={'shares': [MANILA_SHARE_DICT]},
+                ),
+            ]
+        )
+        share = self.cloud.search_shares(filters="[?status=='error'] | [0]")
+        self.assertIsNone(share)
+        self.assert_calls()
+
+    def test_get_share_by_id(self):
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'shared-file-system',
+                        'public',
+                        append=['v2', 'shares', SHARE_ID],
+                    ),
+                    json={'share': MANILA_SHARE_DICT},
+                ),
+            ]
+        )
+        share = self.cloud.get_share_by_id(SHARE_ID)
+        self.assertEqual(SHARE_ID, share.id)
+        self.assert_calls()
+
+    def test_get_share_by_name(self):
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'shared-file-system',
+                        'public',
+                        append=['v2', 'shares', 'share-0'],
+                    ),
+                    status_code=404,
+                ),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'shared-file-system',
+                        'public',
+                        append=['v2', 'shares', 'detail'],
+                        qs_elements=['name=share-0'],
+                    ),
+                    json={'shares': [MANILA_SHARE_DICT]},
+                ),
+            ]
+        )
+        share = self.cloud.get_share('share-0')
+        self.assertEqual(SHARE_ID, share.id)
+        self.assert_calls()
+
+    def test_create_share(self):
+        creating = dict(MANILA_SHARE_DICT, status='creating')
+        self.register_uris(
+            [
+                dict(
+                    method='POST',
+                    uri=self.get_mock_url(
+                        'shared-file-system',
+                        'public',
+                        append=['v2', 'shares'],
+                    ),
+                    json={'share': creating},
+                    validate=dict(
+                        json={
+                            'share': {
+                                'name': 'share-0',
+                                'size': 1,
+                                'share_proto': 'NFS',
+                            }
+                        }
+                    ),
+                ),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'shared-file-system',
+                        'public',
+                        append=['v2', 'shares', SHARE_ID],
+                    ),
+                    json={'share': MANILA_SHARE_DICT},
+                ),
+            ]
+        )
+        share = self.cloud.create_share(1, 'NFS', name='share-0')
+        self.assertEqual(SHARE_ID, share.id)
+        self.assertEqual('available', share.status)
+        self.assert_calls()
+
+    def test_create_share_error(self):
+        self.register_uris(
+            [
+                dict(
+                    method='POST',
+                    uri=self.get_mock_url(
+                        'shared-file-system',
+                        'public',
+                        append=['v2', 'shares'],
+                    ),
+                    json={'share': dict(MANILA_SHARE_DICT, status='error')},
+                ),
+            ]
+        )
+        self.assertRaises(
+            exceptions.SDKException, self.cloud.create_share, 1, 'NFS'
+        )
+        self.assert_calls()
+
+    def test_update_share(self):
+        share_url = self.get_mock_url(
+            'shared-file-system',
+            'public',
+            append=['v2', 'shares', SHARE_ID],
+        )
+        updated = dict(MANILA_SHARE_DICT, display_name='share-1')
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=share_url,
+                    json={'share': MANILA_SHARE_DICT},
+                ),
+                dict(
+                    method='PUT',
+                    uri=share_url,
+                    json={'share': updated},
+                    validate=dict(
+                        json={
+                            'share': {
+                                'display_name': 'share-1',
+                                'is_public': False,
+                            }
+                        }
+                    ),
+                ),
+            ]
+        )
+        share = self.cloud.update_share(
+            SHARE_ID, display_name='share-1', is_public=False
+        )
+        self.assertEqual('share-1', share.display_name)
+        self.assert_calls()
+
+    def test_update_share_missing(self):
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'shared-file-system',
+                        'public',
+                        append=['v2', 'shares', 'share-0'],
+                    ),
+                    status_code=404,
+                ),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'shared-file-system',
+                        'public',
+                        append=['v2', 'shares', 'detail'],
+                        qs_elements=['name=share-0'],
+                    ),
+                    json={'shares': []},
+                ),
+            ]
+        )
+        self.assertRaises(
+            exceptions.SDKException,
+            self.cloud.update_share,
+            'share-0',
+            display_name='share-1',
+        )
+        self.assert_calls()
+
+    def test_delete_share(self):
+        share_url = self.get_mock_url(
+            'shared-file-system',
+            'public',
+            append=['v2', 'shares', SHARE_ID],
+        )
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=share_url,
+                    json={'share': MANILA_SHARE_DICT},
+                ),
+                dict(method='DELETE', uri=share_url),
+                dict(method='GET', uri=share_url, status_code=404),
+            ]
+        )
+        self.assertTrue(self.cloud.delete_share(SHARE_ID))
+        self.assert_calls()
+
+    def test_delete_share_instance(self):
+        share_url = self.get_mock_url(
+            'shared-file-system',
+            'public',
+            append=['v2', 'shares', SHARE_ID],
+        )
+        self.register_uris(
+            [
+                dict(method='DELETE', uri=share_url),
+                dict(method='GET', uri=share_url, status_code=404),
+            ]
+        )
+        share = _share.Share(**MANILA_SHARE_DICT)
+        self.assertTrue(self.cloud.delete_share(share))
+        self.assert_calls()
+
+    def test_delete_share_instance_gone(self):
+        self.register_uris(
+            [
+                dict(
+                    method='DELETE',
+                    uri=self.get_mock_url(
+                        'shared-file-system',
+                        'public',
+                        append=['v2', 'shares', SHARE_ID],
+                    ),
+                    status_code=404,
+                ),
+            ]
+        )
+        share = _share.Share(**MANILA_SHARE_DICT)
+        self.assertFalse(self.cloud.delete_share(share))
+        self.assert_calls()
+
+    def test_delete_share_missing(self):
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'shared-file-system',
+                        'public',
+                        append=['v2', 'shares', 'share-0'],
+                    ),
+                    status_code=404,
+                ),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'shared-file-system',
+                        'public',
+                        append=['v2', 'shares', 'detail'],
+                        qs_elements=['name=share-0'],
+                    ),
+                    json={'shares': []},
+                ),
+            ]
+        )
+        self.assertFalse(self.cloud.delete_share('share-0'))
+        self.assert_calls()
+
+    def test_delete_shares(self):
+        share_url = self.get_mock_url(
+            'shared-file-system',
+            'public',
+            append=['v2', 'shares', SHARE_ID],
+        )
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=share_url,
+                    json={'share': MANILA_SHARE_DICT},
+                ),
+                dict(method='DELETE', uri=share_url),
+                dict(method='GET', uri=share_url, status_code=404),
+            ]
+        )
+        self.assertEqual([True], self.cloud.delete_shares([SHARE_ID]))
+        self.assert_calls()
+
+    def test_delete_shares_results_in_order(self):
+        second_done = threading.Event()
+
+        def _delete_share(name_or_id, **kwargs):
+            if name_or_id == 'share-0':
+                # make the first deletion complete last
+                self.assertTrue(second_done.wait(timeout=10))
+                return True
+            second_done.set()
+            return False
+
+        with mock.patch.object(
+            self.cloud, 'delete_share', side_effect=_delete_share
+        ) as mock_delete:
+            results = self.cloud.delete_shares(
+                ['share-0', 'share-1'], wait=False
+            )
+
+        self.assertEqual([True, False], results)
+        mock_delete.assert_has_calls(
+            [
+                mock.call('share-0', wait=False, timeout=None),
+                mock.call('share-1', wait=False, timeout=None),
+            ],
+            any_order=True,
+        )
+
+    def test_delete_shares_error(self):
+        with mock.patch.object(
+            self.cloud,
+            'delete_share',
+            side_effect=exceptions.SDKException('boom'),
+        ):
+            self.assertRaises(
+                exceptions.SDKException,
+                self.cloud.delete_shares,
+                ['share-0'],
+            )
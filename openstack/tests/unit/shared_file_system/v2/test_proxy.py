@@ -59,7 +59,25 @@ class TestSharedFileSystemShare(TestSharedFileSystemProxy):
         self.verify_get(self.proxy.get_share, share.Share)
 
     def test_share_find(self):
-        self.verify_find(self.proxy.find_share, share.Share)
+        self.verify_find(
+            self.proxy.find_share,
+            share.Share,
+            expected_kwargs={
+                "ignore_missing": True,
+                "list_base_path": "/shares/detail",
+            },
+        )
+
+    def test_share_find_not_detailed(self):
+        self.verify_find(
+            self.proxy.find_share,
+            share.Share,
+            method_kwargs={"details": False},
+            expected_kwargs={
+                "ignore_missing": True,
+                "list_base_path": None,
+            },
+        )
 
     def test_share_delete(self):
         self.verify_delete(self.proxy.delete_share, share.Share, False)
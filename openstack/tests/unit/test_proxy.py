@@ -547,6 +547,41 @@ class TestProxyHead(base.TestCase):
         self.assertEqual(rv, self.fake_result)
 
 
+class TestProxyRequest(base.TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.session = mock.Mock(spec=session.Session)
+        self.session._sdk_connection = self.cloud
+        self.session.get_project_id = mock.Mock(return_value='fake_prj')
+
+        self.response = mock.Mock()
+        self.response.status_code = 200
+        self.response.history = []
+        self.response.headers = {}
+        self.session.request = mock.Mock(return_value=self.response)
+
+        self.sot = proxy.Proxy(self.session)
+        self.sot._connection = self.cloud
+        self.sot.service_type = 'srv'
+
+    def test_connect_retries_default(self):
+        self.sot.connect_retries = None
+        self.sot.get('fake/1')
+
+        self.assertEqual(
+            1, self.session.request.call_args.kwargs['connect_retries']
+        )
+
+    def test_connect_retries_configured(self):
+        self.sot.connect_retries = 3
+        self.sot.get('fake/1')
+
+        self.assertEqual(
+            3, self.session.request.call_args.kwargs['connect_retries']
+        )
+
+
 class TestExtractName(base.TestCase):
     scenarios = [
         ('slash_servers_bare', dict(url='/servers', parts=['servers'])),
@@ -655,6 +690,33 @@ class TestProxyCache(base.TestCase):
         self.sot._get(self.Res, '3')
         self.session.request.assert_called()
 
+    def test_action_invalidates_resource(self):
+        key = self._get_key(5)
+
+        self.cloud._cache.set(key, self.response)
+        self.cloud._api_cache_keys.add(key)
+        self.cloud._cache_expirations['srv.fake'] = 5
+
+        # an action on the resource invalidates the cached resource too
+        self.sot.post('fake/5/action', json={'foo': 'bar'})
+
+        self.session.request.assert_called()
+        self.assertNotIn(key, self.cloud._api_cache_keys)
+        self.assertEqual('NoValue', type(self.cloud._cache.get(key)).__name__)
+
+    def test_head_keeps_resource(self):
+        key = self._get_key(7)
+
+        self.cloud._cache.set(key, self.response)
+        self.cloud._api_cache_keys.add(key)
+        self.cloud._cache_expirations['srv.fake'] = 5
+
+        # a HEAD on a sub-resource is not a modification
+        self.sot.head('fake/7/action')
+
+        self.session.request.assert_called()
+        self.assertIn(key, self.cloud._api_cache_keys)
+
     def test_get_bypass_cache(self):
         key = self._get_key(4)
 